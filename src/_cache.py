@@ -0,0 +1,81 @@
+"""
+Small parquet file cache keyed on the state of upstream input files.
+
+A cache key is a hash of each input file's modification time and size, the
+source code that produced the result, and any extra parameters that affect
+it, so entries are invalidated automatically whenever an upstream parquet is
+rewritten or the computation changes. Each named result keeps only its newest
+entry on disk.
+"""
+
+import hashlib
+import os
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+
+CACHE_DIR_NAME = ".cache"
+
+# Bump to invalidate every cache entry, e.g. when the entry format changes
+CACHE_VERSION = 1
+
+
+def cache_key(paths, *extra, sources=()):
+    """
+    Build a cache key from input file metadata and extra parameters.
+
+    Parameters
+    ----------
+    paths : iterable of Path
+        Input files the cached result depends on
+    *extra : object
+        Additional values (e.g. end date) that affect the result
+    sources : iterable of Path
+        Source files of the code producing the result; their contents are
+        hashed so code changes invalidate old entries
+
+    Returns
+    -------
+    str
+        Hex digest identifying this combination of inputs
+    """
+    parts = [f"v{CACHE_VERSION}"]
+    for source in sources:
+        parts.append(hashlib.md5(Path(source).read_bytes()).hexdigest())
+    for path in paths:
+        stat = Path(path).stat()
+        parts.append(f"{stat.st_mtime_ns}:{stat.st_size}")
+    parts.extend(str(value) for value in extra)
+    return hashlib.md5("|".join(parts).encode()).hexdigest()
+
+
+def cache_path(data_dir, name, key):
+    """Return the parquet path for result name and cache key under data_dir."""
+    return Path(data_dir) / CACHE_DIR_NAME / f"{name}-{key}.parquet"
+
+
+def read_cache(data_dir, name, key):
+    """Return the cached DataFrame for name and key, or None on a cache miss."""
+    path = cache_path(data_dir, name, key)
+    if not path.exists():
+        return None
+    try:
+        return pd.read_parquet(path)
+    except (OSError, pa.ArrowException):
+        return None  # Corrupt or partial entry, recompute it
+
+
+def write_cache(data_dir, name, key, df):
+    """Store df as the only cache entry for name in data_dir."""
+    path = cache_path(data_dir, name, key)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Write then rename so concurrent stages never read a partial entry
+    tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+    df.to_parquet(tmp_path)
+    os.replace(tmp_path, path)
+
+    # Older entries for this result can never be hit again
+    for old_path in path.parent.glob(f"{name}-*.parquet"):
+        if old_path != path:
+            old_path.unlink(missing_ok=True)
@@ -0,0 +1,38 @@
+"""
+Column-wise forward fill for 2-D float arrays with a Numba kernel.
+"""
+
+import numpy as np
+from numba import njit, prange
+
+
+@njit(parallel=True, cache=True)
+def _ffill2d_kernel(a):
+    for j in prange(a.shape[1]):
+        last = np.nan
+        for i in range(a.shape[0]):
+            v = a[i, j]
+            if np.isnan(v):
+                a[i, j] = last
+            else:
+                last = v
+
+
+def ffill2d(a):
+    """
+    Forward fill NaNs down each column of a 2-D float array in place.
+
+    Parameters
+    ----------
+    a : np.ndarray
+        C- or F-ordered float32 or float64 array of shape (n_rows, n_cols)
+
+    Returns
+    -------
+    np.ndarray
+        The same array, filled
+    """
+    if a.size == 0:
+        return a
+    _ffill2d_kernel(a)
+    return a
@@ -0,0 +1,19 @@
+"""
+Project path resolution shared by all pipeline modules.
+
+The project root is located once per process and reused, rather than each
+module walking the filesystem for it at import time.
+"""
+
+from functools import cache
+
+import chartbook
+
+
+@cache
+def project_root():
+    """Return the project root directory, resolving it only on first call."""
+    return chartbook.env.get_project_root()
+
+
+BASE_DIR = project_root()
@@ -4,7 +4,9 @@ Compatibility module mapping old API to calc_treasury_swap_basis.
 This stub provides the old function names expected by tests.
 """
 
+import numpy as np
 import pandas as pd
+from numba import njit, prange
 
 from settings import config
 from pull_bbg_treas_swap import load_syields, load_tyields
@@ -12,6 +14,16 @@ from pull_bbg_treas_swap import load_syields, load_tyields
 DATA_DIR = config("DATA_DIR")
 
 
+@njit(parallel=True, cache=True)
+def _calc_kernel(t, s, out):
+    """Fill out with [100 * (s - t), 100 * s], rows split across threads."""
+    n_tenors = t.shape[1]
+    for i in prange(t.shape[0]):
+        for j in range(n_tenors):
+            out[i, j] = 100.0 * (s[i, j] - t[i, j])
+            out[i, n_tenors + j] = 100.0 * s[i, j]
+
+
 def calc_swap_spreads(treasury_df, swap_df):
     """Combines the treasury and swap data and calculates the spreads.
 
@@ -21,28 +33,38 @@ def calc_swap_spreads(treasury_df, swap_df):
     """
     # Flatten MultiIndex columns if present
     if isinstance(treasury_df.columns, pd.MultiIndex):
-        treasury_df = treasury_df.copy()
-        treasury_df.columns = treasury_df.columns.get_level_values(0)
+        treasury_df = treasury_df.set_axis(
+            treasury_df.columns.get_level_values(0), axis=1
+        )
     if isinstance(swap_df.columns, pd.MultiIndex):
-        swap_df = swap_df.copy()
-        swap_df.columns = swap_df.columns.get_level_values(0)
+        swap_df = swap_df.set_axis(swap_df.columns.get_level_values(0), axis=1)
 
     s_years = [1, 2, 3, 5, 10, 20, 30]
-    merged_df = pd.merge(
-        swap_df, treasury_df, left_index=True, right_index=True, how="inner"
-    )
-    for i in s_years:
-        merged_df[f"Arb_Swap_{i}"] = 100 * (
-            -merged_df[f"GT{i} Govt"] + merged_df[f"USSO{i} CMPN Curncy"]
-        )
-        merged_df[f"tswap_{i}_rf"] = merged_df[f"USSO{i} CMPN Curncy"] * 100
+    if not treasury_df.index.is_monotonic_increasing:
+        treasury_df = treasury_df.sort_index()
+    if not swap_df.index.is_monotonic_increasing:
+        swap_df = swap_df.sort_index()
+    merged_df = pd.concat([swap_df, treasury_df], axis=1, join="inner")
+    if not isinstance(merged_df.index, pd.DatetimeIndex):
+        merged_df.index = pd.to_datetime(merged_df.index, cache=True)
+    merged_df = merged_df.loc[merged_df.index.year >= 2000]
 
-    merged_df["Year"] = pd.to_datetime(merged_df.index).year
-    merged_df = merged_df[merged_df["Year"] >= 2000]
+    treas = np.ascontiguousarray(
+        merged_df[[f"GT{i} Govt" for i in s_years]].to_numpy(dtype=np.float64)
+    )
+    swap = np.ascontiguousarray(
+        merged_df[[f"USSO{i} CMPN Curncy" for i in s_years]].to_numpy(dtype=np.float64)
+    )
+    out = np.empty((treas.shape[0], 2 * len(s_years)), dtype=np.float64)
+    _calc_kernel(treas, swap, out)
 
     arb_list = [f"Arb_Swap_{x}" for x in s_years]
     tswap_list = [f"tswap_{x}_rf" for x in s_years]
-    merged_df = merged_df[arb_list + tswap_list]
+    merged_df = pd.DataFrame(
+        out,
+        index=merged_df.index,
+        columns=arb_list + tswap_list,
+    )
     merged_df = merged_df.dropna(how="all")
 
     return merged_df
@@ -21,12 +21,22 @@ sys.path.insert(0, "./src")
 import pandas as pd
 import numpy as np
 
-import chartbook
+try:
+    import polars as pl
+except ImportError:  # polars is optional, fall back to the pandas path
+    pl = None
+
+from _paths import BASE_DIR
 import pull_bbg_treasury_swap
+from _cache import cache_key, read_cache, write_cache
+import _ffill_numba
+from _ffill_numba import ffill2d
 
-BASE_DIR = chartbook.env.get_project_root()
 DATA_DIR = BASE_DIR / "_data"
 
+# Modules whose code determines the basis; cached results depend on them
+CACHE_SOURCES = [__file__, _ffill_numba.__file__, pull_bbg_treasury_swap.__file__]
+
 # Mapping from Bloomberg tickers to tenor names
 TREASURY_MAPPING = {
     "USGG1YR": "1Y",
@@ -86,24 +96,24 @@ def prepare_data(treasury_df, swap_df):
 
     # Clean up column names - extract ticker from Bloomberg format
     def clean_columns(df, mapping, suffix):
-        new_cols = {}
-        for col in df.columns:
-            if "_PX_LAST" in col:
-                ticker = col.split()[0]
-                if ticker in mapping:
-                    new_cols[col] = f"{mapping[ticker]}_{suffix}"
-        df = df.rename(columns=new_cols)
-        return df
+        cols = df.columns.to_series().astype(str)
+        tickers = cols.str.split(" ", n=1).str[0]
+        mask = cols.str.contains("_PX_LAST", regex=False) & tickers.isin(mapping)
+        new_cols = np.where(mask, tickers.map(mapping).astype(str) + f"_{suffix}", cols)
+        return df.set_axis(pd.Index(new_cols), axis=1)
 
     treasury_df = clean_columns(treasury_df, TREASURY_MAPPING, "Treasury")
     swap_df = clean_columns(swap_df, SWAP_MAPPING, "Swap")
 
-    # Merge dataframes
-    df_merged = treasury_df.merge(
-        swap_df, left_index=True, right_index=True, how="inner"
-    )
+    # Merge dataframes on their shared, sorted date index
+    if not treasury_df.index.is_monotonic_increasing:
+        treasury_df = treasury_df.sort_index()
+    if not swap_df.index.is_monotonic_increasing:
+        swap_df = swap_df.sort_index()
+    df_merged = pd.concat([treasury_df, swap_df], axis=1, join="inner")
 
-    return df_merged
+    # Rates in percent only need single precision for bps-scale spreads
+    return df_merged.astype(np.float32)
 
 
 def compute_treasury_swap_basis(df_merged):
@@ -123,18 +133,28 @@ def compute_treasury_swap_basis(df_merged):
     pd.DataFrame
         DataFrame with basis spreads for each tenor
     """
-    tenors = ["1Y", "2Y", "3Y", "5Y", "10Y", "20Y", "30Y"]
-
-    for tenor in tenors:
-        treas_col = f"{tenor}_Treasury"
-        swap_col = f"{tenor}_Swap"
-        output_col = OUTPUT_COLUMNS[tenor]
-
-        if treas_col in df_merged.columns and swap_col in df_merged.columns:
-            # Basis = Treasury - Swap, converted to basis points
-            df_merged[output_col] = (df_merged[treas_col] - df_merged[swap_col]) * 100
-
-    return df_merged
+    tenors = [
+        tenor
+        for tenor in ["1Y", "2Y", "3Y", "5Y", "10Y", "20Y", "30Y"]
+        if f"{tenor}_Treasury" in df_merged.columns
+        and f"{tenor}_Swap" in df_merged.columns
+    ]
+    treas_cols = [f"{tenor}_Treasury" for tenor in tenors]
+    swap_cols = [f"{tenor}_Swap" for tenor in tenors]
+
+    # Basis = Treasury - Swap, converted to basis points, on the whole block
+    treas = df_merged[treas_cols].to_numpy(dtype=np.float32, copy=False)
+    swap = df_merged[swap_cols].to_numpy(dtype=np.float32, copy=False)
+    basis = np.subtract(treas, swap)
+    basis *= 100.0
+
+    basis_df = pd.DataFrame(
+        basis,
+        index=df_merged.index,
+        columns=[OUTPUT_COLUMNS[tenor] for tenor in tenors],
+    )
+    df_merged = df_merged.drop(columns=basis_df.columns, errors="ignore")
+    return pd.concat([df_merged, basis_df], axis=1)
 
 
 def calculate_treasury_swap_basis(end_date=None, data_dir=DATA_DIR):
@@ -157,9 +177,44 @@ def calculate_treasury_swap_basis(end_date=None, data_dir=DATA_DIR):
 
     print(">> Calculating Treasury-Swap basis...")
 
+    # Reuse a previous result if the input parquets are unchanged
+    key = cache_key(
+        [data_dir / "treasury_yields.parquet", data_dir / "swap_rates.parquet"],
+        end_date,
+        sources=CACHE_SOURCES,
+    )
+    basis_df = read_cache(data_dir, "treasury_swap_basis", key)
+    if basis_df is not None:
+        print(f">> Records: {len(basis_df):,} (cached)")
+        return basis_df
+
+    if pl is not None:
+        basis_df = _calculate_basis_polars(data_dir, end_date=end_date)
+    else:
+        basis_df = _calculate_basis_pandas(data_dir, end_date=end_date)
+
+    # Both paths yield the same nanosecond DatetimeIndex, whatever the
+    # input date type, so the output schema does not depend on polars
+    basis_df.index = pd.DatetimeIndex(
+        pd.to_datetime(basis_df.index), name="index"
+    ).as_unit("ns")
+    write_cache(data_dir, "treasury_swap_basis", key, basis_df)
+
+    print(f">> Records: {len(basis_df):,}")
+    return basis_df
+
+
+def _calculate_basis_pandas(data_dir, end_date=None):
+    """Compute the forward-filled basis with pandas and NumPy."""
     # Load data
-    treasury_df = pull_bbg_treasury_swap.load_treasury_yields(data_dir=data_dir)
-    swap_df = pull_bbg_treasury_swap.load_swap_rates(data_dir=data_dir)
+    treasury_df = pull_bbg_treasury_swap.load_treasury_yields(
+        data_dir=data_dir,
+        columns=["index", *(f"{t} Index_PX_LAST" for t in TREASURY_MAPPING)],
+    )
+    swap_df = pull_bbg_treasury_swap.load_swap_rates(
+        data_dir=data_dir,
+        columns=["index", *(f"{t} Curncy_PX_LAST" for t in SWAP_MAPPING)],
+    )
 
     # Prepare data
     df_merged = prepare_data(treasury_df, swap_df)
@@ -174,13 +229,72 @@ def calculate_treasury_swap_basis(end_date=None, data_dir=DATA_DIR):
 
     # Extract just the basis columns
     basis_cols = [col for col in OUTPUT_COLUMNS.values() if col in df_merged.columns]
-    basis_df = df_merged[basis_cols].copy()
+    basis = df_merged[basis_cols].to_numpy(dtype=np.float32, copy=True)
 
     # Forward fill missing values
-    basis_df = basis_df.ffill()
+    ffill2d(basis)
+    return pd.DataFrame(basis, index=df_merged.index, columns=basis_cols)
 
-    print(f">> Records: {len(basis_df):,}")
-    return basis_df
+
+def _tenor_columns(names, mapping):
+    """Map tenors to the Bloomberg ``<ticker> ..._PX_LAST`` columns in names."""
+    return {
+        mapping[name.split()[0]]: name
+        for name in names
+        if "_PX_LAST" in name and name.split()[0] in mapping
+    }
+
+
+def _calculate_basis_polars(data_dir, end_date=None):
+    """
+    Compute the forward-filled basis as a single lazy Polars query.
+
+    The join, subtraction, and forward fill are planned together and only
+    the needed columns are read from the parquet inputs. Inputs that store
+    their dates as the pandas index rather than an 'index' column are
+    handled by the pandas path instead.
+    """
+    treasury = pl.scan_parquet(data_dir / "treasury_yields.parquet")
+    swap = pl.scan_parquet(data_dir / "swap_rates.parquet")
+
+    treas_names = treasury.collect_schema().names()
+    swap_names = swap.collect_schema().names()
+    if "index" not in treas_names or "index" not in swap_names:
+        return _calculate_basis_pandas(data_dir, end_date=end_date)
+
+    treas_cols = _tenor_columns(treas_names, TREASURY_MAPPING)
+    swap_cols = _tenor_columns(swap_names, SWAP_MAPPING)
+    tenors = [t for t in OUTPUT_COLUMNS if t in treas_cols and t in swap_cols]
+    basis_cols = [OUTPUT_COLUMNS[t] for t in tenors]
+
+    lf = treasury.select(["index", *(treas_cols[t] for t in tenors)]).join(
+        swap.select(["index", *(swap_cols[t] for t in tenors)]),
+        on="index",
+        how="inner",
+    )
+    if end_date:
+        lf = lf.filter(pl.col("index") <= pd.Timestamp(end_date).to_pydatetime())
+
+    basis = (
+        lf.select(
+            "index",
+            *(
+                (
+                    (
+                        pl.col(treas_cols[t]).cast(pl.Float32)
+                        - pl.col(swap_cols[t]).cast(pl.Float32)
+                    )
+                    * 100
+                ).alias(OUTPUT_COLUMNS[t])
+                for t in tenors
+            ),
+        )
+        .sort("index")
+        .with_columns(pl.col(basis_cols).fill_nan(None).forward_fill())
+        .collect()
+    )
+
+    return basis.to_pandas().set_index("index")
 
 
 def load_treasury_swap_basis(data_dir=DATA_DIR):
@@ -193,7 +307,9 @@ def main():
     DATA_DIR.mkdir(parents=True, exist_ok=True)
 
     basis_df = calculate_treasury_swap_basis(data_dir=DATA_DIR)
-    basis_df.to_parquet(DATA_DIR / "treasury_swap_basis.parquet")
+    pull_bbg_treasury_swap.write_parquet(
+        basis_df, DATA_DIR / "treasury_swap_basis.parquet"
+    )
     print(">> Saved treasury_swap_basis.parquet")
 
 
@@ -12,25 +12,60 @@ import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
 
+try:
+    import numexpr as ne
+except ImportError:  # numexpr is optional
+    ne = None
+
 from settings import config
 from supplementary import supplementary_main
 
 # Defaults for plotting windows
-DEFAULT_START_DATE = pd.Timestamp("1998-01-01").date()
+DEFAULT_START_DATE = np.datetime64("1998-01-01", "ns")
 DEFAULT_END_DATE = None  # None means use full available range
 
 # Specific cut-off used for the replicated figure
-REPLICATION_END_DATE = pd.Timestamp("2025-08-01").date()
+REPLICATION_END_DATE = np.datetime64("2025-08-01", "ns")
 
 DATA_DIR = config("DATA_DIR")
 OUTPUT_DIR = config("OUTPUT_DIR")
 
+# Load plotly.js from the CDN instead of embedding ~3 MB in every HTML file
+_WRITE_HTML_KWARGS = {
+    "include_plotlyjs": "cdn",
+    "validate": False,
+    "config": {"responsive": True},
+}
+
+
+def _as_datetime64(value) -> Optional[np.datetime64]:
+    """Normalize a plot window boundary to np.datetime64, converting only if needed."""
+    if value is None or isinstance(value, np.datetime64):
+        return value
+    return pd.Timestamp(value).to_datetime64()
+
+
+def _with_datetime_index(df: pd.DataFrame) -> pd.DataFrame:
+    """Return df with a DatetimeIndex so it can be sliced by np.datetime64 bounds."""
+    if isinstance(df.index, pd.DatetimeIndex):
+        return df
+    return df.set_axis(pd.to_datetime(df.index), axis=0)
+
+
+def _log100(mat: np.ndarray) -> np.ndarray:
+    """Return log(100 * mat), fused into a single numexpr pass when available."""
+    if ne is not None:
+        return ne.evaluate("log(mat) + C", local_dict={"mat": mat, "C": np.log(100.0)})
+    logs = np.log(mat)
+    logs += np.log(100.0)
+    return logs
+
 
 def plot_figure(
     arb_df: pd.DataFrame,
     save_path: str | Path,
-    start_date: Optional[date | pd.Timestamp] = DEFAULT_START_DATE,
-    end_date: Optional[date | pd.Timestamp] = DEFAULT_END_DATE,
+    start_date: Optional[date | pd.Timestamp | np.datetime64] = DEFAULT_START_DATE,
+    end_date: Optional[date | pd.Timestamp | np.datetime64] = DEFAULT_END_DATE,
 ) -> go.Figure:
     """
     Create and save the primary Treasury-Swap arbitrage plot using Plotly.
@@ -44,27 +79,35 @@ def plot_figure(
     Returns
     - Plotly Figure object
     """
-    start_dt = pd.to_datetime(start_date).date() if start_date is not None else None
-    end_dt = pd.to_datetime(end_date).date() if end_date is not None else None
+    start_dt = _as_datetime64(start_date)
+    end_dt = _as_datetime64(end_date)
+
+    years = [
+        year
+        for year in [1, 2, 3, 5, 10, 20, 30]
+        if f"Arb_Swap_{year}" in arb_df.columns
+    ]
+    # Locate the plot window once on the shared sorted index; each tenor
+    # is then a view slice of its column
+    arb_df = _with_datetime_index(arb_df)
+    idx_vals = arb_df.index.values
+    lo = np.searchsorted(idx_vals, start_dt) if start_dt is not None else 0
+    hi = (
+        np.searchsorted(idx_vals, end_dt, side="right")
+        if end_dt is not None
+        else len(idx_vals)
+    )
+    x = idx_vals[lo:hi]
 
     fig = go.Figure()
 
-    for year in [1, 2, 3, 5, 10, 20, 30]:
-        col_name = f"Arb_Swap_{year}"
-        if col_name not in arb_df.columns:
-            continue
-        series = arb_df[col_name]
-        if start_dt is not None and end_dt is not None:
-            series = series.loc[start_dt:end_dt].dropna()
-        elif start_dt is not None:
-            series = series.loc[start_dt:].dropna()
-        else:
-            series = series.dropna()
-
+    for year in years:
+        y = arb_df[f"Arb_Swap_{year}"].to_numpy()[lo:hi]
+        mask = ~pd.isna(y)
         fig.add_trace(
             go.Scatter(
-                x=series.index,
-                y=series.values,
+                x=x[mask],
+                y=y[mask],
                 mode="lines",
                 name=f"{year}Y",
             )
@@ -76,15 +119,15 @@ def plot_figure(
         yaxis_title="Arbitrage Spread (bps)",
     )
 
-    fig.write_html(save_path)
+    fig.write_html(save_path, **_WRITE_HTML_KWARGS)
     return fig
 
 
 def plot_supplementary(
     replication_df: pd.DataFrame,
     save_path: str | Path,
-    start_date: Optional[date | pd.Timestamp] = DEFAULT_START_DATE,
-    end_date: Optional[date | pd.Timestamp] = DEFAULT_END_DATE,
+    start_date: Optional[date | pd.Timestamp | np.datetime64] = DEFAULT_START_DATE,
+    end_date: Optional[date | pd.Timestamp | np.datetime64] = DEFAULT_END_DATE,
 ) -> None:
     """
     Create and save supplementary plots of log Treasury and Swap rates using Plotly.
@@ -95,40 +138,45 @@ def plot_supplementary(
     - start_date: Start date for the plot window
     - end_date: End date for the plot window
     """
-    start_dt = pd.to_datetime(start_date).date() if start_date is not None else None
-    end_dt = pd.to_datetime(end_date).date() if end_date is not None else None
+    start_dt = _as_datetime64(start_date)
+    end_dt = _as_datetime64(end_date)
 
     base_path = Path(save_path)
 
-    for year in [1, 2, 3, 5, 10, 20, 30]:
-        trea_col = f"GT{year} Govt"
-        swap_col = f"USSO{year} CMPN Curncy"
-
-        if trea_col not in replication_df.columns or swap_col not in replication_df.columns:
-            continue
-
-        trea = replication_df[trea_col]
-        swap = replication_df[swap_col]
-
-        if start_dt is not None and end_dt is not None:
-            trea = trea.loc[start_dt:end_dt]
-            swap = swap.loc[start_dt:end_dt]
-        elif start_dt is not None:
-            trea = trea.loc[start_dt:]
-            swap = swap.loc[start_dt:]
-
-        # Drop non-positive values before taking logs
-        trea_plot = trea.dropna()
-        trea_plot = trea_plot[trea_plot > 0]
-        swap_plot = swap.dropna()
-        swap_plot = swap_plot[swap_plot > 0]
+    # Slice the plot window once for all tenors
+    replication_df = _with_datetime_index(replication_df)
+    if start_dt is not None or end_dt is not None:
+        replication_df = replication_df.loc[start_dt:end_dt]
+
+    years = [
+        year
+        for year in [1, 2, 3, 5, 10, 20, 30]
+        if f"GT{year} Govt" in replication_df.columns
+        and f"USSO{year} CMPN Curncy" in replication_df.columns
+    ]
+    all_cols = [f"GT{year} Govt" for year in years] + [
+        f"USSO{year} CMPN Curncy" for year in years
+    ]
+
+    # log(100 * x) for every tenor column in one pass; non-positive values
+    # become NaN and are dropped before plotting
+    mat = replication_df[all_cols].to_numpy(dtype=np.float64)
+    mat = np.where(mat > 0, mat, np.nan)
+    logs = _log100(mat)
+    x = replication_df.index
+
+    for k, year in enumerate(years):
+        trea_log = logs[:, k]
+        swap_log = logs[:, k + len(years)]
+        trea_mask = ~np.isnan(trea_log)
+        swap_mask = ~np.isnan(swap_log)
 
         fig = go.Figure()
 
         fig.add_trace(
             go.Scatter(
-                x=trea_plot.index,
-                y=np.log(100 * trea_plot),
+                x=x[trea_mask],
+                y=trea_log[trea_mask],
                 mode="lines",
                 name=f"{year}Y Treasury",
             )
@@ -136,8 +184,8 @@ def plot_supplementary(
 
         fig.add_trace(
             go.Scatter(
-                x=swap_plot.index,
-                y=np.log(100 * swap_plot),
+                x=x[swap_mask],
+                y=swap_log[swap_mask],
                 mode="lines",
                 name=f"{year}Y Swap",
             )
@@ -150,7 +198,7 @@ def plot_supplementary(
         )
 
         year_path = base_path.with_name(f"{base_path.stem}{year}{base_path.suffix}")
-        fig.write_html(year_path)
+        fig.write_html(year_path, **_WRITE_HTML_KWARGS)
 
 
 def plot_main(data_dir: Path = DATA_DIR) -> None:
@@ -4,44 +4,70 @@ Compatibility module mapping old API to pull_bbg_treasury_swap.
 This stub provides the old function names expected by tests.
 """
 
+from functools import lru_cache
 from pathlib import Path
 
 import pandas as pd
 
-import chartbook
+from _paths import BASE_DIR
 import pull_bbg_treasury_swap
 
-BASE_DIR = chartbook.env.get_project_root()
 DATA_DIR = BASE_DIR / "_data"
 
 
+@lru_cache(maxsize=None)
 def pull_raw_tyields(start_date="2000-01-01", end_date=None):
-    """Load raw Treasury yields from local data file."""
+    """Load raw Treasury yields from local data file.
+
+    The result is cached per process and shared between callers; copy it
+    before modifying in place.
+    """
     df = pd.read_parquet(DATA_DIR / "raw_tyields.parquet")
     return df
 
 
+@lru_cache(maxsize=None)
 def pull_raw_syields(start_date="2000-01-01", end_date=None):
-    """Load raw Swap yields from local data file."""
+    """Load raw Swap yields from local data file.
+
+    The result is cached per process and shared between callers; copy it
+    before modifying in place.
+    """
     df = pd.read_parquet(DATA_DIR / "raw_syields.parquet")
     return df
 
 
+def _to_numeric_frame(raw_df):
+    """Coerce every column to a numeric dtype with direct pd.to_numeric calls."""
+    # Keyed by position so duplicate column labels are kept
+    return pd.DataFrame(
+        {
+            i: pd.to_numeric(raw_df.iloc[:, i], errors="coerce")
+            for i in range(raw_df.shape[1])
+        },
+        index=raw_df.index,
+    ).set_axis(raw_df.columns, axis=1)
+
+
 def clean_raw_tyields(raw_df):
     """Clean Treasury yields by coercing numeric dtypes."""
-    return raw_df.apply(pd.to_numeric, errors="coerce")
+    return _to_numeric_frame(raw_df)
 
 
 def clean_raw_syields(raw_df):
     """Clean Swap yields by coercing numeric dtypes."""
-    return raw_df.apply(pd.to_numeric, errors="coerce")
+    return _to_numeric_frame(raw_df)
 
 
-def load_tyields(data_dir=DATA_DIR):
+def load_tyields(data_dir=DATA_DIR, columns=None):
     """Load cleaned Treasury yields from disk."""
-    return pd.read_parquet(data_dir / "tyields.parquet")
+    return pull_bbg_treasury_swap.read_parquet_columns(
+        Path(data_dir) / "tyields.parquet", columns=columns
+    )
 
 
-def load_syields(data_dir=DATA_DIR):
+def load_syields(data_dir=DATA_DIR, columns=None):
     """Load cleaned Swap yields from disk."""
-    return pd.read_parquet(data_dir / "syields.parquet")
+    return pull_bbg_treasury_swap.read_parquet_columns(
+        Path(data_dir) / "syields.parquet", columns=columns
+    )
@@ -12,9 +12,8 @@ sys.path.insert(0, "./src")
 
 import pandas as pd
 
-import chartbook
+from _paths import BASE_DIR
 
-BASE_DIR = chartbook.env.get_project_root()
 DATA_DIR = BASE_DIR / "_data"
 END_DATE = pd.Timestamp.today().strftime("%Y-%m-%d")
 
@@ -73,44 +72,93 @@ def pull_treasury_swap_data(start_date="1990-01-01", end_date=END_DATE):
 
     print(">> Pulling Treasury-Swap data from Bloomberg...")
 
-    # Pull Treasury yields
-    print("   Pulling Treasury yields...")
-    treasury_df = process_bloomberg_df(
+    # Pull Treasury yields and swap rates in a single request
+    print("   Pulling Treasury yields and swap rates...")
+    df = process_bloomberg_df(
         blp.bdh(
-            tickers=treasury_tickers,
+            tickers=treasury_tickers + swap_tickers,
             flds=fields,
             start_date=start_date,
             end_date=end_date,
         )
     )
+    if df.empty:
+        return {
+            "treasury_yields": df,
+            "swap_rates": df,
+        }
+
+    return split_treasury_swap(df)
 
-    # Pull swap rates
-    print("   Pulling swap rates...")
-    swap_df = process_bloomberg_df(
-        blp.bdh(
-            tickers=swap_tickers,
-            flds=fields,
-            start_date=start_date,
-            end_date=end_date,
-        )
-    )
+
+def split_treasury_swap(df):
+    """
+    Split a combined Bloomberg frame into Treasury and swap frames.
+
+    The combined request returns the union of both sets of trading dates, so
+    rows where every column of one split is NaN are dropped from that split.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Flattened bdh output with an 'index' date column
+
+    Returns
+    -------
+    dict
+        Dictionary with 'treasury_yields' and 'swap_rates' DataFrames
+    """
+    treasury_cols = [c for c in df.columns if c.startswith("USGG")]
+    swap_cols = [c for c in df.columns if c.startswith("USSW")]
 
     return {
-        "treasury_yields": treasury_df,
-        "swap_rates": swap_df,
+        "treasury_yields": df[["index", *treasury_cols]].dropna(
+            how="all", subset=treasury_cols
+        ),
+        "swap_rates": df[["index", *swap_cols]].dropna(how="all", subset=swap_cols),
     }
 
 
-def load_treasury_yields(data_dir=DATA_DIR):
+def read_parquet_columns(path, columns=None):
+    """
+    Read a parquet file with pyarrow, decoding only the requested columns.
+
+    Requested columns that are not present in the file are ignored.
+    """
+    import pyarrow.parquet as pq
+
+    if columns is not None:
+        available = set(pq.read_schema(path).names)
+        columns = [col for col in columns if col in available]
+    table = pq.read_table(
+        path, columns=columns, memory_map=True, use_pandas_metadata=True
+    )
+    return table.to_pandas(self_destruct=True, split_blocks=True)
+
+
+def write_parquet(df, path, index=True):
+    """Write df to parquet with zstd compression and dictionary encoding."""
+    df.to_parquet(
+        path,
+        engine="pyarrow",
+        compression="zstd",
+        compression_level=3,
+        row_group_size=65536,
+        use_dictionary=True,
+        index=index,
+    )
+
+
+def load_treasury_yields(data_dir=DATA_DIR, columns=None):
     """Load Treasury yields from parquet file."""
-    path = data_dir / "treasury_yields.parquet"
-    return pd.read_parquet(path)
+    path = Path(data_dir) / "treasury_yields.parquet"
+    return read_parquet_columns(path, columns=columns)
 
 
-def load_swap_rates(data_dir=DATA_DIR):
+def load_swap_rates(data_dir=DATA_DIR, columns=None):
     """Load swap rates from parquet file."""
-    path = data_dir / "swap_rates.parquet"
-    return pd.read_parquet(path)
+    path = Path(data_dir) / "swap_rates.parquet"
+    return read_parquet_columns(path, columns=columns)
 
 
 def main():
@@ -120,10 +168,12 @@ def main():
     data = pull_treasury_swap_data()
 
     # Save each dataset to parquet
-    data["treasury_yields"].to_parquet(DATA_DIR / "treasury_yields.parquet")
+    write_parquet(
+        data["treasury_yields"], DATA_DIR / "treasury_yields.parquet", index=False
+    )
     print(f">> Saved treasury_yields.parquet")
 
-    data["swap_rates"].to_parquet(DATA_DIR / "swap_rates.parquet")
+    write_parquet(data["swap_rates"], DATA_DIR / "swap_rates.parquet", index=False)
     print(f">> Saved swap_rates.parquet")
 
 
@@ -4,9 +4,7 @@ Stub settings module for test compatibility.
 Provides config function that maps to chartbook environment.
 """
 
-import chartbook
-
-BASE_DIR = chartbook.env.get_project_root()
+from _paths import BASE_DIR
 
 
 def config(key, default=None):
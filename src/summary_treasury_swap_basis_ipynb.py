@@ -6,16 +6,35 @@ Treasury-Swap arbitrage spreads measuring the difference between Treasury yields
 """
 
 # %%
+import os
 import sys
 sys.path.insert(0, "./src")
 
+import numpy as np
 import pandas as pd
+import matplotlib
+
+# Batch runs (python/doit) render headless with Agg; notebook kernels keep
+# their inline backend so the exported HTML still embeds the figures
+IN_KERNEL = 'ipykernel' in sys.modules
+if os.environ.get('MPLBACKEND') is None and not IN_KERNEL:
+    matplotlib.use('Agg')
+SHOW_PLOTS = IN_KERNEL or bool(os.environ.get('SHOW_PLOTS'))
+
+import matplotlib.dates as mdates
 import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection
+from matplotlib.lines import Line2D
 import seaborn as sns
 
-import chartbook
+try:
+    from bottleneck import nanmax, nanmin
+except ImportError:  # bottleneck is optional, fall back to NumPy's nan-reductions
+    from numpy import nanmax, nanmin
+
+from _cache import cache_key
+from _paths import BASE_DIR
 
-BASE_DIR = chartbook.env.get_project_root()
 DATA_DIR = BASE_DIR / "_data"
 
 # %%
@@ -48,15 +67,55 @@ Results are expressed in basis points.
 """
 
 # %%
-df = pd.read_parquet(DATA_DIR / "ftsfr_treasury_swap_basis.parquet")
-print(f"Shape: {df.shape}")
-print(f"Columns: {df.columns.tolist()}")
-print(f"\nDate range: {df['ds'].min()} to {df['ds'].max()}")
-print(f"Number of series: {df['unique_id'].nunique()}")
+# The wide (dates x series) matrix is cached next to the parquet and reused
+# while the parquet's mtime and size and the build logic are unchanged
+path = DATA_DIR / "ftsfr_treasury_swap_basis.parquet"
+cache_file = DATA_DIR / ".basis_wide.feather"
+sig_file = DATA_DIR / ".basis_wide.sig"
+# Bump whenever the matrix build below changes, to invalidate old caches
+BASIS_WIDE_VERSION = 1
+# Series in term order; pivoted columns follow this order without a sort
+series_order = [f'Arb_Swap_{y}' for y in (1, 2, 3, 5, 10, 20, 30)]
+sig = cache_key([path], f"basis_wide-v{BASIS_WIDE_VERSION}", *series_order)
+
+if cache_file.exists() and sig_file.exists() and sig_file.read_text() == sig:
+    basis_wide = pd.read_feather(cache_file).set_index('ds')
+    basis_wide.columns.name = 'unique_id'
+else:
+    df = pd.read_parquet(path, columns=['ds', 'unique_id', 'y'], engine='pyarrow')
+
+    unique_id = pd.Categorical(
+        df['unique_id'], categories=series_order, ordered=True
+    ).remove_unused_categories()
+    id_inv = unique_id.codes
+    keep = id_inv >= 0  # rows outside the documented series are not summarized
+
+    # Scatter the long rows straight into a preallocated (dates x series) matrix
+    dates, date_inv = np.unique(df['ds'].to_numpy()[keep], return_inverse=True)
+    M = np.full((dates.size, len(unique_id.categories)), np.nan)
+    M[date_inv, id_inv[keep]] = df['y'].to_numpy()[keep]
+    basis_wide = pd.DataFrame(
+        M,
+        index=pd.DatetimeIndex(dates, name='ds'),
+        columns=pd.Index(unique_id.categories, name='unique_id'),
+    )
+
+    basis_wide.reset_index().to_feather(cache_file)
+    sig_file.write_text(sig)
+
+# NumPy views shared by the statistics and every figure below
+X = basis_wide.index.values
+Y = basis_wide.to_numpy()
+col_idx = {c: i for i, c in enumerate(basis_wide.columns)}
+
+print(f"Shape (dates x series): {basis_wide.shape}")
+print(f"Non-null observations: {int(np.isfinite(Y).sum()):,}")
+print(f"\nDate range: {basis_wide.index.min()} to {basis_wide.index.max()}")
+print(f"Number of series: {basis_wide.shape[1]}")
 
 # %%
 print("\nSeries:")
-for series in sorted(df['unique_id'].unique()):
+for series in basis_wide.columns:
     print(f"  {series}")
 
 # %%
@@ -65,10 +124,28 @@ for series in sorted(df['unique_id'].unique()):
 """
 
 # %%
-basis_wide = df.pivot(index='ds', columns='unique_id', values='y')
-basis_stats = basis_wide.describe().T
-basis_stats['skewness'] = basis_wide.skew()
-basis_stats['kurtosis'] = basis_wide.kurtosis()
+# All moments from one pass over the matrix; skewness and kurtosis use the
+# same bias-corrected estimators as pandas' skew() and kurtosis()
+A = Y
+valid = np.isfinite(A)
+n = valid.sum(axis=0)
+mean = np.where(valid, A, 0.0).sum(axis=0) / n
+d = np.where(valid, A - mean, 0.0)
+d2 = d * d
+m2, m3, m4 = d2.sum(axis=0) / n, (d2 * d).sum(axis=0) / n, (d2 * d2).sum(axis=0) / n
+g1 = m3 / m2**1.5
+g2 = m4 / m2**2 - 3
+basis_stats = pd.DataFrame(
+    {
+        'mean': mean,
+        'std': np.sqrt(m2 * n / (n - 1)),
+        'min': nanmin(A, axis=0),
+        'max': nanmax(A, axis=0),
+        'skewness': np.sqrt(n * (n - 1)) / (n - 2) * g1,
+        'kurtosis': ((n + 1) * g2 + 6) * (n - 1) / ((n - 2) * (n - 3)),
+    },
+    index=basis_wide.columns,
+)
 print(basis_stats[['mean', 'std', 'min', 'max', 'skewness', 'kurtosis']].round(2).to_string())
 
 # %%
@@ -77,21 +154,34 @@ print(basis_stats[['mean', 'std', 'min', 'max', 'skewness', 'kurtosis']].round(2
 """
 
 # %%
+def add_lines(ax, cols, **kwargs):
+    """Draw basis_wide[cols] as a single LineCollection; return legend handles."""
+    x = mdates.date2num(X)
+    segs = [np.column_stack([x, Y[:, col_idx[col]]]) for col in cols]
+    colors = plt.cm.tab10.colors[:len(segs)]
+    ax.add_collection(LineCollection(segs, colors=colors, rasterized=True, **kwargs))
+    ax.autoscale()
+    ax.xaxis_date()
+    return [Line2D([], [], color=c, **kwargs) for c in colors]
+
+
 fig, ax = plt.subplots(figsize=(14, 8))
 
-for col in basis_wide.columns:
-    ax.plot(basis_wide.index, basis_wide[col], label=col, alpha=0.8, linewidth=1)
+handles = add_lines(ax, basis_wide.columns, alpha=0.8, linewidth=1)
 
 ax.axhline(y=0, color='black', linestyle='--', alpha=0.5)
 ax.set_xlabel('Date')
 ax.set_ylabel('Basis (bps)')
 ax.set_title('Treasury-Swap Basis (Treasury Yield - Swap Rate)')
-ax.legend(loc='upper center', bbox_to_anchor=(0.5, -0.1), ncol=4)
+ax.legend(
+    handles, basis_wide.columns, loc='upper center', bbox_to_anchor=(0.5, -0.1), ncol=4
+)
 ax.grid(True, alpha=0.3)
 
 plt.tight_layout()
-plt.savefig(DATA_DIR.parent / "_output" / "treasury_swap_basis.png", dpi=150, bbox_inches='tight')
-plt.show()
+plt.savefig(DATA_DIR.parent / "_output" / "treasury_swap_basis.png", dpi=150)
+if SHOW_PLOTS:
+    plt.show()
 
 # %%
 """
@@ -102,32 +192,33 @@ plt.show()
 fig, axes = plt.subplots(1, 2, figsize=(14, 5))
 
 # Short-term (1Y, 2Y, 3Y)
-short_cols = ['Arb_Swap_1', 'Arb_Swap_2', 'Arb_Swap_3']
-for col in short_cols:
-    if col in basis_wide.columns:
-        axes[0].plot(basis_wide.index, basis_wide[col], label=col, alpha=0.8)
+short_cols = [
+    c for c in ['Arb_Swap_1', 'Arb_Swap_2', 'Arb_Swap_3'] if c in basis_wide.columns
+]
+short_handles = add_lines(axes[0], short_cols, alpha=0.8)
 axes[0].axhline(y=0, color='black', linestyle='--', alpha=0.5)
 axes[0].set_title('Short-Term Basis (1-3 Year)')
 axes[0].set_xlabel('Date')
 axes[0].set_ylabel('Basis (bps)')
-axes[0].legend()
+axes[0].legend(short_handles, short_cols)
 axes[0].grid(True, alpha=0.3)
 
 # Long-term (10Y, 20Y, 30Y)
-long_cols = ['Arb_Swap_10', 'Arb_Swap_20', 'Arb_Swap_30']
-for col in long_cols:
-    if col in basis_wide.columns:
-        axes[1].plot(basis_wide.index, basis_wide[col], label=col, alpha=0.8)
+long_cols = [
+    c for c in ['Arb_Swap_10', 'Arb_Swap_20', 'Arb_Swap_30'] if c in basis_wide.columns
+]
+long_handles = add_lines(axes[1], long_cols, alpha=0.8)
 axes[1].axhline(y=0, color='black', linestyle='--', alpha=0.5)
 axes[1].set_title('Long-Term Basis (10-30 Year)')
 axes[1].set_xlabel('Date')
 axes[1].set_ylabel('Basis (bps)')
-axes[1].legend()
+axes[1].legend(long_handles, long_cols)
 axes[1].grid(True, alpha=0.3)
 
 plt.tight_layout()
-plt.savefig(DATA_DIR.parent / "_output" / "treasury_swap_basis_by_term.png", dpi=150, bbox_inches='tight')
-plt.show()
+plt.savefig(DATA_DIR.parent / "_output" / "treasury_swap_basis_by_term.png", dpi=100)
+if SHOW_PLOTS:
+    plt.show()
 
 # %%
 """
@@ -136,12 +227,17 @@ plt.show()
 
 # %%
 fig, ax = plt.subplots(figsize=(10, 8))
-corr = basis_wide.corr()
+# Correlations over dates where every tenor is observed
+C = np.corrcoef(basis_wide.dropna().to_numpy(), rowvar=False)
+corr = pd.DataFrame(C, index=basis_wide.columns, columns=basis_wide.columns)
 sns.heatmap(corr, annot=True, fmt='.2f', cmap='RdBu_r', center=0, ax=ax)
 ax.set_title('Treasury-Swap Basis Correlations')
 plt.tight_layout()
-plt.savefig(DATA_DIR.parent / "_output" / "treasury_swap_basis_correlation.png", dpi=150, bbox_inches='tight')
-plt.show()
+plt.savefig(
+    DATA_DIR.parent / "_output" / "treasury_swap_basis_correlation.png", dpi=150
+)
+if SHOW_PLOTS:
+    plt.show()
 
 # %%
 """
@@ -23,6 +23,22 @@ from calc_swap_spreads import calc_swap_spreads
 DATA_DIR = config("DATA_DIR")
 output_dir = config("OUTPUT_DIR")
 
+YEARS = [1, 2, 3, 5, 10, 20, 30]
+T_LIST = [f"GT{year} Govt" for year in YEARS]
+S_LIST = [f"USSO{year} CMPN Curncy" for year in YEARS]
+REPLICATION_START = pd.Timestamp("2010").date()
+
+# Same layout DataFrame.to_latex() produces for a one-column table of means
+LATEX_TABLE_TEMPLATE = (
+    "\\begin{{tabular}}{{lr}}\n"
+    "\\toprule\n"
+    " & Mean(bps) \\\\\n"
+    "\\midrule\n"
+    "{rows}\n"
+    "\\bottomrule\n"
+    "\\end{{tabular}}\n"
+)
+
 
 def replication_df(treasury_df, swap_df):
     """Creates a merged DataFrame of the treasury and swap yields.
@@ -31,16 +47,9 @@ def replication_df(treasury_df, swap_df):
     :param swap_df: DataFrame containing the swap yield data
     :return: The merged data frame
     """
-    years = [1, 2, 3, 5, 10, 20, 30]
-    t_list = [f"GT{year} Govt" for year in years]
-    s_list = [f"USSO{year} CMPN Curncy" for year in years]
-    return pd.merge(
-        treasury_df[t_list].loc[pd.Timestamp("2010").date() :],
-        swap_df[s_list].loc[pd.Timestamp("2010").date() :],
-        left_index=True,
-        right_index=True,
-        how="inner",
-    )
+    t = treasury_df[T_LIST].loc[REPLICATION_START:]
+    s = swap_df[S_LIST].loc[REPLICATION_START:]
+    return t.join(s, how="inner")
 
 
 def sup_table(calc_df, file_name="table.txt"):
@@ -50,13 +59,11 @@ def sup_table(calc_df, file_name="table.txt"):
     :param file_name: name of the text file to save LaTeX table to
     :return: The data frame containing means
     """
-    years = [1, 2, 3, 5, 10, 20, 30]
-    df = calc_df[[f"Arb_Swap_{year}" for year in years]]
-    for year in years:
-        df = df.rename(columns={f"Arb_Swap_{year}": f"Arb Swap {year}"})
+    df = calc_df[[f"Arb_Swap_{year}" for year in YEARS]].copy()
+    df.columns = [f"Arb Swap {year}" for year in YEARS]
     means = df.mean()
-    means.rename()
-    means_str = pd.DataFrame(means, columns=["Mean(bps)"]).to_latex()
+    rows = "\n".join(f"{name} & {val:.6f} \\\\" for name, val in means.items())
+    means_str = LATEX_TABLE_TEMPLATE.format(rows=rows)
     file = DATA_DIR / file_name if not os.path.isabs(file_name) else Path(file_name)
     with open(file, "w") as table:
         table.write(means_str)
@@ -0,0 +1,43 @@
+"""Tests the parquet result cache in _cache."""
+
+import pandas as pd
+
+from _cache import CACHE_DIR_NAME, cache_key, read_cache, write_cache
+
+
+def test_cache_key_tracks_inputs_and_sources(tmp_path):
+    """Keys change when an input file or a source file changes."""
+    data = tmp_path / "input.parquet"
+    source = tmp_path / "module.py"
+    data.write_text("a")
+    source.write_text("x = 1")
+    key = cache_key([data], sources=[source])
+
+    source.write_text("x = 2")
+    assert cache_key([data], sources=[source]) != key
+
+    data.write_text("ab")
+    assert cache_key([data], sources=[source]) != key
+
+
+def test_write_cache_keeps_only_newest_entry(tmp_path):
+    """Writing a new entry for a name removes its older entries only."""
+    df = pd.DataFrame({"y": [1.0, 2.0]})
+    write_cache(tmp_path, "basis", "old", df)
+    write_cache(tmp_path, "other", "old", df)
+    write_cache(tmp_path, "basis", "new", df)
+
+    assert read_cache(tmp_path, "basis", "old") is None
+    pd.testing.assert_frame_equal(read_cache(tmp_path, "basis", "new"), df)
+    assert read_cache(tmp_path, "other", "old") is not None
+    assert sorted(p.name for p in (tmp_path / CACHE_DIR_NAME).iterdir()) == [
+        "basis-new.parquet",
+        "other-old.parquet",
+    ]
+
+
+def test_read_cache_ignores_corrupt_entry(tmp_path):
+    """A truncated entry is treated as a miss."""
+    write_cache(tmp_path, "basis", "k", pd.DataFrame({"y": [1.0]}))
+    (tmp_path / CACHE_DIR_NAME / "basis-k.parquet").write_bytes(b"PAR1")
+    assert read_cache(tmp_path, "basis", "k") is None
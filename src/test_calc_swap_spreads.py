@@ -3,6 +3,7 @@ Tests functions in calc_swap_spreads responsible for calculation and plots.
 """
 
 import pandas as pd
+import pytest
 
 from calc_swap_spreads import calc_swap_spreads
 from pull_bbg_treas_swap import (
@@ -13,17 +14,24 @@ from pull_bbg_treas_swap import (
 )
 
 
-def test_calc_swap_spreads():
-    """Tests calc_swap_spreads to ensure that the output dataframe
-    has the correct data in it.
-    """
-
+@pytest.fixture(scope="session")
+def swap_treasury_frames():
+    """Pull and clean the swap and treasury yields once per test session."""
     raw_syields = pull_raw_syields()
     swap_df = clean_raw_syields(raw_syields)
 
     raw_tyields = pull_raw_tyields()
     treasury_df = clean_raw_tyields(raw_tyields)
 
+    return swap_df, treasury_df
+
+
+def test_calc_swap_spreads(swap_treasury_frames):
+    """Tests calc_swap_spreads to ensure that the output dataframe
+    has the correct data in it.
+    """
+    swap_df, treasury_df = swap_treasury_frames
+
     total_list = []
     output = calc_swap_spreads(treasury_df, swap_df)
     years = [1, 2, 3, 5, 10, 20, 30]
@@ -0,0 +1,72 @@
+"""Tests the pandas and polars paths of calc_treasury_swap_basis."""
+
+import datetime as dt
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import calc_treasury_swap_basis
+from calc_treasury_swap_basis import (
+    SWAP_MAPPING,
+    TREASURY_MAPPING,
+    calculate_treasury_swap_basis,
+)
+
+
+@pytest.fixture(params=["column", "index"])
+def data_dir(request, tmp_path):
+    """Write small date-typed Treasury and swap parquets with gaps.
+
+    Dates are stored either as an 'index' column or as the pandas index.
+    """
+    rng = np.random.default_rng(0)
+    dates = [dt.date(2020, 1, 1) + dt.timedelta(days=i) for i in range(40)]
+
+    treasury = pd.DataFrame(
+        rng.uniform(1, 5, (40, len(TREASURY_MAPPING))),
+        columns=[f"{t} Index_PX_LAST" for t in TREASURY_MAPPING],
+    )
+    treasury.iloc[3:6, 1] = np.nan
+    treasury.iloc[0, 0] = np.nan
+    treasury.insert(0, "index", dates)
+
+    swap = pd.DataFrame(
+        rng.uniform(1, 5, (40, len(SWAP_MAPPING))),
+        columns=[f"{t} Curncy_PX_LAST" for t in SWAP_MAPPING],
+    )
+    swap.iloc[10:12, 4] = np.nan
+    swap.insert(0, "index", dates)
+    # Swap-only dates must not appear in the basis
+    swap = swap.drop(index=[20, 21]).reset_index(drop=True)
+
+    if request.param == "index":
+        # An unnamed index is stored as __index_level_0__, not 'index'
+        treasury = treasury.set_index("index").rename_axis(None)
+        swap = swap.set_index("index").rename_axis(None)
+    treasury.to_parquet(
+        tmp_path / "treasury_yields.parquet", index=request.param == "index"
+    )
+    swap.to_parquet(tmp_path / "swap_rates.parquet", index=request.param == "index")
+    return tmp_path
+
+
+@pytest.mark.parametrize("end_date", [None, "2020-01-25"])
+def test_pandas_and_polars_paths_match(data_dir, monkeypatch, end_date):
+    """Both implementations give the same basis frame once normalised."""
+    pl = pytest.importorskip("polars")
+
+    outputs = []
+    # Without polars the pandas path runs, with it the polars path
+    for module in (None, pl):
+        monkeypatch.setattr(calc_treasury_swap_basis, "pl", module)
+        # Clear the cache so each path computes its own result
+        for entry in (data_dir / ".cache").glob("*"):
+            entry.unlink()
+        outputs.append(calculate_treasury_swap_basis(end_date, data_dir=data_dir))
+
+    pandas_df, polars_df = outputs
+    assert isinstance(pandas_df.index, pd.DatetimeIndex)
+    assert pandas_df.index.dtype == "datetime64[ns]"
+    pd.testing.assert_frame_equal(pandas_df, polars_df)
+    assert len(pandas_df) == (38 if end_date is None else 23)
@@ -0,0 +1,38 @@
+"""Tests the forward-fill kernel in _ffill_numba against DataFrame.ffill."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from _ffill_numba import ffill2d
+
+
+def _sample(dtype, order):
+    """Columns with leading, interior and trailing NaNs plus an all-NaN column."""
+    a = np.array(
+        [
+            [np.nan, 1.0, np.nan, 5.0],
+            [2.0, np.nan, np.nan, np.nan],
+            [np.nan, np.nan, np.nan, 6.0],
+            [3.0, 4.0, np.nan, np.nan],
+            [np.nan, np.nan, np.nan, np.nan],
+        ],
+        dtype=dtype,
+    )
+    return np.asarray(a, order=order)
+
+
+@pytest.mark.parametrize("dtype", [np.float32, np.float64])
+@pytest.mark.parametrize("order", ["C", "F"])
+def test_ffill2d(dtype, order):
+    """The Numba kernel matches DataFrame.ffill."""
+    a = _sample(dtype, order)
+    expected = pd.DataFrame(a).ffill().to_numpy()
+    assert ffill2d(a) is a
+    np.testing.assert_array_equal(a, expected)
+
+
+def test_ffill2d_empty():
+    """Empty arrays are returned unchanged."""
+    a = np.empty((0, 3))
+    assert ffill2d(a) is a
@@ -0,0 +1,41 @@
+"""
+Tests splitting the combined Bloomberg pull in pull_bbg_treasury_swap.
+"""
+
+import numpy as np
+import pandas as pd
+
+from pull_bbg_treasury_swap import split_treasury_swap
+
+
+def test_split_treasury_swap_drops_union_dates():
+    """Dates traded by only one market are dropped from the other split"""
+    df = pd.DataFrame(
+        {
+            "index": pd.to_datetime(
+                ["2020-01-02", "2020-01-03", "2020-01-06", "2020-01-07"]
+            ).date,
+            "USGG2YR Index_PX_LAST": [1.0, np.nan, 1.2, np.nan],
+            "USGG10YR Index_PX_LAST": [2.0, np.nan, np.nan, np.nan],
+            "USSW2 Curncy_PX_LAST": [np.nan, 1.5, 1.6, np.nan],
+            "USSW10 Curncy_PX_LAST": [np.nan, 2.5, np.nan, np.nan],
+        }
+    )
+
+    data = split_treasury_swap(df)
+    treasury, swap = data["treasury_yields"], data["swap_rates"]
+
+    assert list(treasury.columns) == [
+        "index",
+        "USGG2YR Index_PX_LAST",
+        "USGG10YR Index_PX_LAST",
+    ]
+    assert list(swap.columns) == [
+        "index",
+        "USSW2 Curncy_PX_LAST",
+        "USSW10 Curncy_PX_LAST",
+    ]
+    assert list(treasury["index"]) == list(df["index"].iloc[[0, 2]])
+    assert list(swap["index"]) == list(df["index"].iloc[[1, 2]])
+    # Partially missing rows are kept for the downstream forward fill
+    assert np.isnan(treasury["USGG10YR Index_PX_LAST"].iloc[1])
@@ -71,3 +71,17 @@ def test_clean_raw_syields():
     assert ((test_df.dtypes == np.int64) | (test_df.dtypes == np.float64)).all()
 
     assert len(test_df) == test_len
+
+
+def test_clean_raw_tyields_duplicate_columns():
+    """Checking that duplicate column labels survive cleaning, as they
+    do with DataFrame.apply
+    """
+    test_df = pd.DataFrame(
+        [["1", "2.3", "x"], ["4", "5", "6.5"]],
+        index=pd.date_range("2025-01-01", "2025-01-02"),
+        columns=["test1", "test1", "test2"],
+    )
+    expected = test_df.apply(pd.to_numeric, errors="coerce")
+    test_df = pull_bbg_treas_swap.clean_raw_tyields(test_df)
+    pd.testing.assert_frame_equal(test_df, expected)